@@ -1,9 +1,28 @@
+"""
+XML to SystemVerilog Random-Item Converter
+
+Reads a FunctionMap XML description and writes a UVM ``uvm_sequence_item``
+class with one ``rand`` field per <Parameter>/<Field>, range constraints
+from <MinValue>/<MaxValue>, and the <TestConstraint> bodies.  Any
+<TopParameter> entries are additionally exported to a CSV for range
+overrides.
+
+The input is scanned line by line rather than with an XML parser
+(``xml.etree`` / ``lxml``): TestConstraint bodies routinely contain raw
+``<``, ``<=`` and ``&&`` (e.g. ``$ <= width;``), which makes the files
+not well-formed XML, and a conforming XML parser rejects them.
+
+Usage:
+    python XML_to_sv_Converter.py <source_xml> <dest_sv> [top_params.csv]
+"""
+
 from __future__ import annotations
 
 import csv
+import io
 import re
 import sys
-from bisect import bisect_left
+from itertools import chain, count
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -13,104 +32,129 @@ _PATTERN_MAX_VALUE = re.compile(r"<MaxValue>(.+?)</MaxValue>")
 _PATTERN_NORMAL_VALUE = re.compile(r"<NormalValue>(.+?)</NormalValue>")
 _PATTERN_PARAM_NAME = re.compile(r'<Parameter[^>]*name="([^"]+)"')
 _PATTERN_FIELD_NAME = re.compile(r'<Field[^>]*name="([^"]+)"')
-_PATTERN_TC_END = re.compile(r"</TestConstraint>")
-_PATTERN_TC_INLINE = re.compile(r"<TestConstraint>(.*?)</TestConstraint>")
-_PATTERN_TC_LAST = re.compile(r"(.*?)</TestConstraint>")
 
-# XML entity translations — single-pass via compiled alternation
+# Wrapper tags tracked by the block scan, tested with one startswith call
+_WRAPPER_TAGS = ("<SimParameter", "</SimParameter", "<TopParameter", "</TopParameter")
+
+# XML entity translations — decoded by chained str.replace, in this order
+# "&amp;" must stay last: decoding it earlier would turn "&amp;lt;" into "<"
 _XML_ENTITY_MAP = {
     "&lt;": "<",
     "&gt;": ">",
-    '&amp;': '&',
     "&apos;": "'",
     "&quot;": '"',
+    '&amp;': '&',
 }
-_XML_ENTITY_RE = re.compile("|".join(re.escape(k) for k in _XML_ENTITY_MAP))
 
 
-def _entity_replacer(m: re.Match) -> str:
-    return _XML_ENTITY_MAP[m.group()]
+def _decode_entities(text: str) -> str:
+    """Replace XML character entities with their literal characters.
 
+    One C-level ``str.replace`` per entity.  Entities cannot overlap (each
+    runs from an ``&`` to the first ``;``) and no replacement except the
+    final ``&amp;`` produces an ``&``, so this matches a left-to-right
+    decode.  An ``&`` that does not start a known entity is kept as-is.
+    """
+    if "&" not in text:
+        # Common case: nothing to decode, skip the copy entirely
+        return text
+    for entity, char in _XML_ENTITY_MAP.items():
+        text = text.replace(entity, char)
+    return text
 
-def _decode_entities(lines: List[str]) -> List[str]:
-    """Replace XML character entities with their literal characters."""
-    sub = _XML_ENTITY_RE.sub
-    repl = _entity_replacer
-    return [sub(repl, line) for line in lines]
 
+def _read_xml_text(xml_path: str) -> str:
+    """Read *xml_path* as ASCII text in one call.
 
-def _extract_name_from_block(block: List[str], is_field: bool) -> str | None:
-    """Extract parameter or field name from block, return None if invalid."""
-    first_line = block[0]
-    pattern = _PATTERN_FIELD_NAME if is_field else _PATTERN_PARAM_NAME
-    match = pattern.search(first_line)
-    if not match:
-        return None
+    Text mode normalises ``\r\n`` / ``\r`` line endings to ``\n``.  A plain
+    read also works for non-regular inputs such as ``/dev/stdin`` or FIFOs.
+    """
+    with open(xml_path, "r", encoding="ascii", errors="ignore") as f:
+        return f.read()
+
+
+# A collected block: (name captured from its opening line or None, lines)
+_Block = Tuple[Optional[str], List[str]]
 
-    name = match.group(1)
-    return None if ("." in name or "|" in name) else name
 
+def _block_name(block: _Block) -> str | None:
+    """Return the parameter or field name of block, or None if invalid."""
+    name = block[0]
+    if name is None:
+        return None
+    return None if ("." in name or "|" in name) else name
 
-def _extract_value_range(block: List[str]) -> Tuple[int, int, bool]:
-    """Extract min and max values from block."""
-    min_value = max_value = 0
-    has_min_value = False
 
+def _scan_block(
+    block: List[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str], List[str]]:
+    """Extract value tags and TestConstraint content from block.
+
+    Returns (min_value, max_value, normal_value, constraint_body); each
+    value is the raw text of the first such tag on the last line that has
+    one, or None if absent.  Lines of a multi-line constraint are emitted
+    as they are seen and rolled back if the block ends before the closing
+    tag.
+    """
+    min_value = max_value = normal_value = None
+    constraint_body: List[str] = []
+    in_tc = False
+    tc_start = 0
+    has_tc = False
+
+    # One search per tag per line: the first match on a line is used, and a
+    # later line overrides an earlier one.  Substring guards keep the regex
+    # engine off the lines without the tag.
     for stmt in block:
         if "<MinValue>" in stmt:
             match = _PATTERN_MIN_VALUE.search(stmt)
             if match:
-                min_value = int(match.group(1))
-                has_min_value = True
+                min_value = match.group(1)
         if "<MaxValue>" in stmt:
             match = _PATTERN_MAX_VALUE.search(stmt)
             if match:
-                max_value = int(match.group(1))
-
-    return min_value, max_value, has_min_value
-
-
-def _extract_test_constraints(block: List[str]) -> List[str]:
-    """Extract all TestConstraint content from block."""
-    constraint_body = []
-    i = 0
+                max_value = match.group(1)
+        if "<NormalValue>" in stmt:
+            match = _PATTERN_NORMAL_VALUE.search(stmt)
+            if match:
+                normal_value = match.group(1)
+        if not has_tc and "<TestConstraint>" in stmt:
+            has_tc = True
 
-    while i < len(block):
-        stmt = block[i]
-        if "<TestConstraint>" in stmt:
-            # Find closing tag
-            tc_end_idx = -1
-            for j in range(i, len(block)):
-                if _PATTERN_TC_END.search(block[j]):
-                    tc_end_idx = j
-                    break
+    # Most blocks carry no constraint; skip the constraint walk for them
+    if not has_tc:
+        return min_value, max_value, normal_value, constraint_body
 
-            if tc_end_idx == -1:
-                i += 1
+    for stmt in block:
+        if not in_tc:
+            if "<TestConstraint>" not in stmt:
                 continue
-
-            if tc_end_idx == i:
+            if "</TestConstraint>" in stmt:
                 # Single-line constraint
-                match = _PATTERN_TC_INLINE.search(stmt)
-                if match:
-                    constraint_body.append(f"       {match.group(1)}")
+                _, _, rest = stmt.partition("<TestConstraint>")
+                inline, found, _ = rest.partition("</TestConstraint>")
+                if found:
+                    constraint_body.append(f"       {inline}")
                     constraint_body.append("\n")
-            else:
-                # Multi-line constraint
-                first = stmt.replace("<TestConstraint>", "").strip()
-                constraint_body.append(f"       {first}\n")
-                for j in range(i + 1, tc_end_idx):
-                    constraint_body.append(f"       {block[j].strip()}\n")
-                last_match = _PATTERN_TC_LAST.search(block[tc_end_idx])
-                if last_match:
-                    constraint_body.append(f"       {last_match.group(1)}")
-                constraint_body.append("\n")
-
-            i = tc_end_idx + 1
+                continue
+            # Opening line of a multi-line constraint
+            in_tc = True
+            tc_start = len(constraint_body)
+            first = stmt.replace("<TestConstraint>", "").strip()
+            constraint_body.append(f"       {first}\n")
+        elif "</TestConstraint>" in stmt:
+            last = stmt.partition("</TestConstraint>")[0]
+            constraint_body.append(f"       {last}")
+            constraint_body.append("\n")
+            in_tc = False
         else:
-            i += 1
+            constraint_body.append(f"       {stmt.strip()}\n")
+
+    if in_tc:
+        # Unterminated constraint — drop its partial body
+        del constraint_body[tc_start:]
 
-    return constraint_body
+    return min_value, max_value, normal_value, constraint_body
 
 
 # -----------------------------------------------------------------------------
@@ -140,31 +184,23 @@ class TopParamInfo:
         self.test_constraints = test_constraints or []
 
 
-def _extract_top_param_from_block(block: List[str]) -> Optional[TopParamInfo]:
+def _extract_top_param_from_block(block: _Block) -> Optional[TopParamInfo]:
     """Extract a TopParamInfo from a <Parameter> block inside <TopParameter>."""
-    name = _extract_name_from_block(block, is_field=False)
+    name = _block_name(block)
     if name is None:
         return None
 
-    min_val = "0"
-    max_val = "0"
-    normal_val = "0"
+    min_text, max_text, normal_text, tc_body = _scan_block(block[1])
+    min_val = "0" if min_text is None else min_text.strip()
+    max_val = "0" if max_text is None else max_text.strip()
+    normal_val = "0" if normal_text is None else normal_text.strip()
 
-    for stmt in block:
-        m = _PATTERN_MIN_VALUE.search(stmt)
-        if m:
-            min_val = m.group(1).strip()
-        m = _PATTERN_MAX_VALUE.search(stmt)
-        if m:
-            max_val = m.group(1).strip()
-        m = _PATTERN_NORMAL_VALUE.search(stmt)
-        if m:
-            normal_val = m.group(1).strip()
-
-    # Extract TestConstraint bodies (reuse existing function)
-    tc_body = _extract_test_constraints(block)
-    # Replace $ placeholders with the field name
-    tc_lines = [c.replace("$", name).strip() for c in tc_body if c.strip()]
+    # Replace $ placeholders with the field name (only on lines that have one)
+    tc_lines = [
+        (c.replace("$", name) if "$" in c else c).strip()
+        for c in tc_body
+        if c.strip()
+    ]
 
     return TopParamInfo(
         name=name,
@@ -175,50 +211,11 @@ def _extract_top_param_from_block(block: List[str]) -> Optional[TopParamInfo]:
     )
 
 
-def _extract_top_parameters(xml: List[str]) -> Tuple[List[TopParamInfo], List[Tuple[int, int]]]:
-    """Scan the XML for <TopParameter> sections.
-
-    Returns:
-        top_params  : List of TopParamInfo objects.
-        span_ranges : List of (start_line, end_line) inclusive indices for each
-                      <TopParameter>…</TopParameter> block so the caller can
-                      skip those lines during regular parameter collection.
-    """
-    top_params: List[TopParamInfo] = []
-    span_ranges: List[Tuple[int, int]] = []
-
-    i = 0
-    while i < len(xml):
-        stripped = xml[i].strip()
-        if stripped.startswith("<TopParameter") and not stripped.startswith("</TopParameter"):
-            block_start = i
-            # Find matching </TopParameter>
-            j = i + 1
-            while j < len(xml):
-                if xml[j].strip().startswith("</TopParameter"):
-                    break
-                j += 1
-            block_end = j
-            span_ranges.append((block_start, block_end))
-
-            # Now parse individual <Parameter> blocks inside
-            inner = xml[block_start + 1 : block_end]
-            param_close_idx = _build_close_index(inner, "</Parameter>")
-            for k, line in enumerate(inner):
-                if _PATTERN_PARAM_NAME.search(line):
-                    end_idx = _find_close(param_close_idx, k + 1)
-                    if end_idx == -1:
-                        end_idx = len(inner) - 1
-                    param_block = inner[k : end_idx + 1]
-                    info = _extract_top_param_from_block(param_block)
-                    if info is not None:
-                        top_params.append(info)
-
-            i = block_end + 1
-        else:
-            i += 1
-
-    return top_params, span_ranges
+# Column order of the TopParameter CSV
+_TOP_CSV_HEADER = (
+    "Name", "NormalValue", "MinValue", "MaxValue",
+    "OverrideMin", "OverrideMax", "TestConstraint",
+)
 
 
 def export_top_params_csv(
@@ -235,21 +232,19 @@ def export_top_params_csv(
     """
     with open(csv_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow([
-            "Name", "NormalValue", "MinValue", "MaxValue",
-            "OverrideMin", "OverrideMax", "TestConstraint",
-        ])
-        for p in top_params:
-            tc_str = " ; ".join(p.test_constraints) if p.test_constraints else ""
-            writer.writerow([
+        writer.writerow(_TOP_CSV_HEADER)
+        writer.writerows(
+            (
                 p.name,
                 p.normal_value,
                 p.min_value,
                 p.max_value,
                 p.override_min,
                 p.override_max,
-                tc_str,
-            ])
+                " ; ".join(p.test_constraints),
+            )
+            for p in top_params
+        )
 
 
 def load_top_params_csv(csv_path: str) -> List[TopParamInfo]:
@@ -260,20 +255,31 @@ def load_top_params_csv(csv_path: str) -> List[TopParamInfo]:
     """
     params: List[TopParamInfo] = []
     with open(csv_path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        # Plain rows plus a column index resolved once from the header,
+        # instead of a dict per row; absent columns map to None
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {key: i for i, key in enumerate(header)}
+        i_name, i_normal, i_min, i_max, i_omin, i_omax, i_tc = (
+            col.get(key) for key in _TOP_CSV_HEADER
+        )
+        width = len(header)
         for row in reader:
-            name = row.get("Name", "").strip()
+            if len(row) < width:
+                # Short (hand-edited) rows read as empty trailing cells
+                row += [""] * (width - len(row))
+            name = row[i_name].strip() if i_name is not None else ""
             if not name:
                 continue
             info = TopParamInfo(
                 name=name,
-                normal_value=row.get("NormalValue", "0").strip(),
-                min_value=row.get("MinValue", "0").strip(),
-                max_value=row.get("MaxValue", "0").strip(),
+                normal_value=row[i_normal].strip() if i_normal is not None else "0",
+                min_value=row[i_min].strip() if i_min is not None else "0",
+                max_value=row[i_max].strip() if i_max is not None else "0",
             )
-            info.override_min = row.get("OverrideMin", info.min_value).strip()
-            info.override_max = row.get("OverrideMax", info.max_value).strip()
-            tc_str = row.get("TestConstraint", "").strip()
+            info.override_min = row[i_omin].strip() if i_omin is not None else info.min_value
+            info.override_max = row[i_omax].strip() if i_omax is not None else info.max_value
+            tc_str = row[i_tc].strip() if i_tc is not None else ""
             if tc_str:
                 info.test_constraints = [c.strip() for c in tc_str.split(";") if c.strip()]
             params.append(info)
@@ -281,34 +287,36 @@ def load_top_params_csv(csv_path: str) -> List[TopParamInfo]:
 
 
 # -----------------------------------------------------------------------------
-# Block processing — returns classified output directly
-# (rand_decls, uvm_fields, range_constraints, test_constraints)
-# This eliminates the post-hoc _classify_and_collect_lines re-scan.
+# Block processing — appends classified fragments straight to the shared
+# output lists, so no post-hoc _classify_and_collect_lines re-scan is needed
 # -----------------------------------------------------------------------------
+# Output accumulators shared by every block:
+# (rand_decls, uvm_fields, range_constraints, test_constraints)
+_Fragments = Tuple[List[str], List[str], List[str], List[str]]
+
+
 def _process_block(
-    block: List[str],
+    block: _Block,
     idx_offset: int,
-    is_field: bool,
-) -> Tuple[List[str], List[str], List[str], List[str]]:
+    out: _Fragments,
+) -> None:
     """
     Process a Parameter or Field block.
-    Returns (rand_decls, uvm_fields, range_constraints, test_constraints).
+    Appends its fragments to out (rand_decls, uvm_fields,
+    range_constraints, test_constraints).
     """
-    name = _extract_name_from_block(block, is_field)
+    name = _block_name(block)
     if name is None:
-        return [], [], [], []
-
-    min_value, max_value, has_min_value = _extract_value_range(block)
-    constraint_body = _extract_test_constraints(block)
+        return
 
-    # Replace $ with variable name in constraints
-    const = [c.replace("$", name) for c in constraint_body]
+    min_text, max_text, _, constraint_body = _scan_block(block[1])
+    has_min_value = min_text is not None
+    min_value = int(min_text) if has_min_value else 0
+    max_value = 0 if max_text is None else int(max_text)
 
-    # Build SystemVerilog fragments — classified at source
-    rand_decls: List[str] = []
-    uvm_fields: List[str] = []
-    range_constraints: List[str] = []
-    test_constraints: List[str] = []
+    # Build SystemVerilog fragments — classified at source and appended
+    # straight to the shared accumulators
+    rand_decls, uvm_fields, range_constraints, test_constraints = out
 
     # Declare variable
     if min_value >= 0:
@@ -317,55 +325,133 @@ def _process_block(
         rand_decls.append(f" rand bit signed [31:0] {name};\n")
     uvm_fields.append(f" `uvm_field_int({name}, UVM_DEFAULT)\n")
 
-    # Add range constraint if min/max present
+    # Add range constraint if min/max present (one fragment per construct)
     if has_min_value:
-        range_constraints.extend([
-            f"   constraint CR_VAR_RANGE_{name}\n",
-            "     {\n",
-            f"       ({name} >= {min_value} && {name} <= {max_value});\n",
-            "     }\n\n",
-        ])
-
-    # Add test constraints if present
-    if constraint_body:
-        test_constraints.extend([
-            f"   constraint cr{idx_offset}\n",
-            "     {\n",
-            *const,
-            "     }\n\n",
-        ])
+        range_constraints.append(
+            f"   constraint CR_VAR_RANGE_{name}\n"
+            f"     {{\n"
+            f"       ({name} >= {min_value} && {name} <= {max_value});\n"
+            f"     }}\n\n"
+        )
 
-    return rand_decls, uvm_fields, range_constraints, test_constraints
+    # Add test constraints if present; $ placeholders are substituted once
+    # over the joined body, and only when one is actually present
+    if constraint_body:
+        const = "".join(constraint_body)
+        if "$" in const:
+            const = const.replace("$", name)
+        test_constraints.append(
+            f"   constraint cr{idx_offset}\n"
+            f"     {{\n"
+            f"{const}"
+            f"     }}\n\n"
+        )
 
 
-def _process_parameter_block(
-    block: List[str],
-    idx_offset: int,
-) -> Tuple[List[str], List[str], List[str], List[str]]:
-    """Parse a <Parameter> block."""
-    return _process_block(block, idx_offset, is_field=False)
+# -----------------------------------------------------------------------------
+# Line scanner — one pass over the decoded XML
+# -----------------------------------------------------------------------------
+def _scan_xml(
+    xml: List[str],
+) -> Tuple[str, List[_Block], List[_Block], List[_Block]]:
+    """Collect everything the generator needs from *xml* in a single pass.
+
+    Returns (ip_name, param_blocks, field_blocks, top_blocks):
+        param_blocks : <Parameter> blocks outside <SimParameter> (TopParameter
+                       entries included — they stay in the SV class).
+        field_blocks : <Field> blocks.
+        top_blocks   : <Parameter> blocks inside a <TopParameter> wrapper, cut
+                       off at the wrapper's end tag if left unterminated.
+
+    Each block is opened on the line that names it and closed at the next
+    matching end tag, so no line is visited twice.  Blocks are returned as
+    (name, lines) pairs; the name is the one the opening line's regex
+    captured (None for a Field line it does not match), so block
+    processing never searches for it again.
+    """
+    ip_name = ""
+    param_blocks: List[_Block] = []
+    field_blocks: List[_Block] = []
+    top_blocks: List[_Block] = []
+    in_sim_parameter = False
+    in_top_parameter = False
 
+    # (start line, name) of blocks whose end tag has not been reached yet
+    open_params: List[Tuple[int, Optional[str]]] = []
+    open_fields: List[Tuple[int, Optional[str]]] = []
+    open_tops: List[Tuple[int, Optional[str]]] = []
+    # Bind hot-loop lookups to locals once
+    search_param = _PATTERN_PARAM_NAME.search
+    search_field = _PATTERN_FIELD_NAME.search
+    wrapper_tags = _WRAPPER_TAGS
 
-def _process_field_block(
-    block: List[str],
-    idx_offset: int,
-) -> Tuple[List[str], List[str], List[str], List[str]]:
-    """Parse a <Field> block."""
-    return _process_block(block, idx_offset, is_field=True)
+    for i, line in enumerate(xml):
+        # Extract IP name (once — later lines skip the substring search)
+        if not ip_name and 'FunctionMap IP' in line:
+            ip_name = line.split('"', 2)[1].lower()
+
+        # Every tag handled below contains "Parameter" or "Field"; two
+        # substring tests reject the remaining lines up front
+        if "Parameter" not in line and "Field" not in line:
+            continue
+
+        # Close any blocks opened on earlier lines
+        has_param_end = "</Parameter>" in line
+        if open_params and has_param_end:
+            param_blocks.extend((name, xml[start:i + 1]) for start, name in open_params)
+            open_params.clear()
+        if open_fields and "</Field>" in line:
+            field_blocks.extend((name, xml[start:i + 1]) for start, name in open_fields)
+            open_fields.clear()
+
+        # Track SimParameter blocks (skip entirely) and TopParameter
+        # wrapper tags (but process inner Parameters) — one prefix test
+        # rejects every other line before the individual checks
+        was_top = in_top_parameter
+        # Only the leading side matters for the prefix tests below
+        stripped = line.lstrip()
+        if stripped.startswith(wrapper_tags):
+            if stripped.startswith("<SimParameter"):
+                in_sim_parameter = True
+            elif stripped.startswith("</SimParameter"):
+                in_sim_parameter = False
+            elif stripped.startswith("<TopParameter"):
+                in_top_parameter = True
+            else:
+                in_top_parameter = False
+
+        # The literal guard keeps the regex off lines that cannot match;
+        # the captured name travels with the block
+        param_match = search_param(line) if "<Parameter" in line else None
+
+        # TopParameter entries: the wrapper's own tag lines are not part of
+        # any entry, and entries left open end at </TopParameter>
+        if was_top:
+            if not in_top_parameter:
+                top_blocks.extend((name, xml[start:i]) for start, name in open_tops)
+                open_tops.clear()
+            else:
+                if open_tops and has_param_end:
+                    top_blocks.extend((name, xml[start:i + 1]) for start, name in open_tops)
+                    open_tops.clear()
+                if param_match is not None:
+                    open_tops.append((i, param_match.group(1)))
 
+        # Open Parameter blocks (skip SimParameter, include TopParameter)
+        if param_match is not None and not in_sim_parameter:
+            open_params.append((i, param_match.group(1)))
 
-# -----------------------------------------------------------------------------
-# Closing-tag index builder (replaces O(n²) forward scans)
-# -----------------------------------------------------------------------------
-def _build_close_index(xml: List[str], tag: str) -> List[int]:
-    """Return sorted list of line indices containing the given closing tag."""
-    return [i for i, line in enumerate(xml) if tag in line]
+        # Open Field blocks
+        if 'Field name' in line:
+            field_match = search_field(line)
+            open_fields.append((i, field_match.group(1) if field_match else None))
 
+    # Unterminated blocks run to end of file
+    param_blocks.extend((name, xml[start:]) for start, name in open_params)
+    field_blocks.extend((name, xml[start:]) for start, name in open_fields)
+    top_blocks.extend((name, xml[start:]) for start, name in open_tops)
 
-def _find_close(indices: List[int], start: int) -> int:
-    """Return the first index in *indices* that is >= *start*, or len(xml)."""
-    pos = bisect_left(indices, start)
-    return indices[pos] if pos < len(indices) else -1
+    return ip_name, param_blocks, field_blocks, top_blocks
 
 
 def generate_rand_item(xml_path: str, sv_path: str, top_csv_path: str = "") -> None:
@@ -379,18 +465,26 @@ def generate_rand_item(xml_path: str, sv_path: str, top_csv_path: str = "") -> N
     # Read XML file
     print(f"Processing file: {xml_path} …", end=" ")
     try:
-        with open(xml_path, "r", encoding="ascii", errors="ignore") as f:
-            raw_xml = f.readlines()
+        raw_xml = _read_xml_text(xml_path)
         print("opened")
     except Exception as e:
         print(f"failed ({e})")
         return
 
-    # Decode XML entities
-    xml = _decode_entities(raw_xml)
+    # Decode XML entities in one pass over the whole file, then split on
+    # "\n" only, like readlines() (str.splitlines would also break on \f,
+    # \v and \x1c-\x1e, adding lines inside TestConstraint bodies)
+    xml = io.StringIO(_decode_entities(raw_xml)).readlines()
+
+    # Single scan: IP name, Parameter/Field blocks and TopParameter blocks
+    ip_name, param_blocks, field_blocks, top_blocks = _scan_xml(xml)
 
     # --- TopParameter extraction (export to CSV, but keep in SV) ---
-    top_params, _ = _extract_top_parameters(xml)
+    top_params: List[TopParamInfo] = []
+    for blk in top_blocks:
+        info = _extract_top_param_from_block(blk)
+        if info is not None:
+            top_params.append(info)
     if top_params:
         # Default CSV path: alongside SV output
         if not top_csv_path:
@@ -398,73 +492,23 @@ def generate_rand_item(xml_path: str, sv_path: str, top_csv_path: str = "") -> N
             top_csv_path = str(Path(sv_path).parent / f"{sv_stem}_top_params.csv")
         export_top_params_csv(top_params, top_csv_path)
 
-    # Scan for IP name and collect Parameter/Field blocks
-    ip_name = ""
-    param_blocks: List[List[str]] = []
-    field_blocks: List[List[str]] = []
-    in_sim_parameter = False
-    in_top_parameter = False
-
-    # Pre-index closing tags — O(n) once instead of O(n) per match
-    param_close_idx = _build_close_index(xml, "</Parameter>")
-    field_close_idx = _build_close_index(xml, "</Field>")
-
-    for i, line in enumerate(xml):
-        # Extract IP name
-        if 'FunctionMap IP' in line:
-            ip_name = line.split('"')[1].lower()
-
-        # Track SimParameter blocks (skip entirely)
-        stripped = line.strip()
-        in_sim_parameter = (
-            in_sim_parameter if not stripped.startswith("<SimParameter") else True
-        )
-        if stripped.startswith("</SimParameter"):
-            in_sim_parameter = False
-
-        # Track TopParameter wrapper tags (but process inner Parameters)
-        if stripped.startswith("<TopParameter") and not stripped.startswith("</TopParameter"):
-            in_top_parameter = True
-        if stripped.startswith("</TopParameter"):
-            in_top_parameter = False
-
-        # Collect Parameter blocks (skip SimParameter, include TopParameter)
-        if not in_sim_parameter and _PATTERN_PARAM_NAME.search(line):
-            end_idx = _find_close(param_close_idx, i + 1)
-            if end_idx == -1:
-                end_idx = len(xml)
-            param_blocks.append(xml[i:end_idx + 1])
-
-        # Collect Field blocks
-        if 'Field name' in line:
-            end_idx = _find_close(field_close_idx, i + 1)
-            if end_idx == -1:
-                end_idx = len(xml)
-            field_blocks.append(xml[i:end_idx + 1])
-
-    sys.stdout.write("\n")
-
-    # Process blocks sequentially (ThreadPoolExecutor removed —
-    # CPU-bound string work under GIL gains nothing from threads)
+    # Process blocks sequentially (CPU-bound string work: threads gain nothing
+    # under the GIL, and worker processes cost more in pickling than they save)
     all_rand: List[str] = []
     all_uvm: List[str] = []
     all_range: List[str] = []
     all_test: List[str] = []
-
-    for idx, blk in enumerate(param_blocks):
-        rand, uvm, rng, tc = _process_parameter_block(blk, idx)
-        all_rand.extend(rand)
-        all_uvm.extend(uvm)
-        all_range.extend(rng)
-        all_test.extend(tc)
-
-    field_offset_start = len(param_blocks) + 1
-    for idx, blk in enumerate(field_blocks):
-        rand, uvm, rng, tc = _process_field_block(blk, field_offset_start + idx)
-        all_rand.extend(rand)
-        all_uvm.extend(uvm)
-        all_range.extend(rng)
-        all_test.extend(tc)
+    out = (all_rand, all_uvm, all_range, all_test)
+
+    # Constraint indices: Parameters count up from 0 and Fields from
+    # len(param_blocks) + 1.  The skipped index is kept on purpose — the
+    # cr<N> names of every previously generated class depend on it.
+    numbered = chain(
+        zip(count(), param_blocks),
+        zip(count(len(param_blocks) + 1), field_blocks),
+    )
+    for idx, blk in numbered:
+        _process_block(blk, idx, out)
 
     # Assemble final SystemVerilog class
     my_file = [
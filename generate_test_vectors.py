@@ -30,15 +30,17 @@ import argparse
 import importlib
 import subprocess
 import random
-import math
 import time
 import multiprocessing
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
 
-# Parameter override support (optional import — module lives alongside)
+# Parameter override support (optional import — module lives alongside).
+# top_param_override is only a re-export wrapper around param_override,
+# so there is nothing to fall back to if this import fails.
 try:
     from param_override import (
         load_overrides,
@@ -50,19 +52,45 @@ try:
     )
     _HAS_OVERRIDE = True
 except ImportError:
-    # Backward compat: try old module name
-    try:
-        from top_param_override import (
-            load_overrides,
-            randomize_with_overrides,
-            patch_vector_with_overrides,
-            apply_overrides_to_sv_file,
-            print_override_summary,
-            OverrideSpec,
-        )
-        _HAS_OVERRIDE = True
-    except ImportError:
-        _HAS_OVERRIDE = False
+    _HAS_OVERRIDE = False
+
+# Precompiled patterns for parse_pyvsc_file
+# Field declarations in __init__:
+#   self.field_name = vsc.rand_bit_t(N) or vsc.rand_int32_t() etc.
+_PATTERN_FIELD_DECL = re.compile(r'self\.(\w+)\s*=\s*(vsc\.\w+(?:_t)?\([^)]*\))')
+# (tag, pattern, type_name, bit_width, is_signed) for the type expression.
+# bit_width None means the width is captured by the "<tag>_w" group.
+_TYPE_PATTERNS = [
+    # Parameterized types
+    ('bit', r'vsc\.rand_bit_t\((?P<bit_w>\d+)\)', 'bit', None, False),
+    ('randc_bit', r'vsc\.randc_bit_t\((?P<randc_bit_w>\d+)\)', 'randc_bit', None, False),
+    # Fixed-width unsigned types
+    ('uint8', r'vsc\.rand_uint8_t\(\)', 'uint8', 8, False),
+    ('uint16', r'vsc\.rand_uint16_t\(\)', 'uint16', 16, False),
+    ('uint32', r'vsc\.rand_uint32_t\(\)', 'uint32', 32, False),
+    ('uint64', r'vsc\.rand_uint64_t\(\)', 'uint64', 64, False),
+    # Fixed-width signed types
+    ('int8', r'vsc\.rand_int8_t\(\)', 'int8', 8, True),
+    ('int16', r'vsc\.rand_int16_t\(\)', 'int16', 16, True),
+    ('int32', r'vsc\.rand_int32_t\(\)', 'int32', 32, True),
+    ('int64', r'vsc\.rand_int64_t\(\)', 'int64', 64, True),
+    # Enum type
+    ('enum', r'vsc\.rand_enum_t\(\w+\)', 'enum', 32, False),
+]
+# All type patterns as one alternation; the matching branch is m.lastgroup
+_PATTERN_TYPE = re.compile('|'.join(f'(?P<{tag}>{pat})' for tag, pat, *_ in _TYPE_PATTERNS))
+_TYPE_META = {tag: (type_name, bit_width, is_signed)
+              for tag, _, type_name, bit_width, is_signed in _TYPE_PATTERNS}
+# Constraint ranges: self.field in vsc.rangelist(vsc.rng(min, max))
+_PATTERN_RANGE = re.compile(
+    r'self\.(\w+)\s+in\s+vsc\.rangelist\(vsc\.rng\((-?\d+),\s*(-?\d+)\)\)'
+)
+# Discrete values: self.field in vsc.rangelist(val1, val2, ...), nested parens allowed
+_PATTERN_DISCRETE = re.compile(
+    r'self\.(\w+)\s+in\s+vsc\.rangelist\(([^)]+(?:\([^)]*\)[^)]*)*)\)'
+)
+# Enum references such as YuvFormat.YUV_444
+_PATTERN_ENUM_REF = re.compile(r'(\w+)\.(\w+)')
 
 
 @dataclass
@@ -93,13 +121,17 @@ class FieldStats:
         if not self.values:
             return
 
-        # Filter numeric values
-        numeric_values = []
-        for v in self.values:
-            try:
-                numeric_values.append(int(v))
-            except (ValueError, TypeError):
-                pass
+        # Convert to int in one C-level pass; fall back to filtering only
+        # when some value is non-numeric
+        try:
+            numeric_values = list(map(int, self.values))
+        except (ValueError, TypeError):
+            numeric_values = []
+            for v in self.values:
+                try:
+                    numeric_values.append(int(v))
+                except (ValueError, TypeError):
+                    pass
 
         if not numeric_values:
             return
@@ -111,20 +143,21 @@ class FieldStats:
         # Determine if signed (has negative values)
         self.is_signed = self.min_val < 0
 
-        # Calculate bit width needed
+        # Calculate bit width needed; int.bit_length() is exact, unlike
+        # ceil(log2(n + 1)), which rounds wrongly from 2**49 up
         if self.is_signed:
             # Signed: need to accommodate both positive and negative
             abs_max = max(abs(self.min_val), abs(self.max_val))
             if abs_max == 0:
                 self.bit_width = 1
             else:
-                self.bit_width = int(math.ceil(math.log2(abs_max + 1))) + 1  # +1 for sign bit
+                self.bit_width = abs_max.bit_length() + 1  # +1 for sign bit
         else:
             # Unsigned
             if self.max_val == 0:
                 self.bit_width = 1
             else:
-                self.bit_width = int(math.ceil(math.log2(self.max_val + 1)))
+                self.bit_width = self.max_val.bit_length()
 
         # Ensure minimum bit width of 1
         self.bit_width = max(1, self.bit_width)
@@ -163,55 +196,31 @@ def parse_pyvsc_file(module_name: str) -> Dict[str, FieldSpec]:
 
     # Try to find the source file
     pyvsc_file = _module_to_path(module_name, ".py")
-    if not os.path.exists(pyvsc_file):
+    try:
+        with open(pyvsc_file, 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
         print(f"Warning: Could not find PyVSC source file: {pyvsc_file}")
         return field_specs
 
-    with open(pyvsc_file, 'r') as f:
-        content = f.read()
-
-    # Parse field declarations in __init__
-    # Pattern: self.field_name = vsc.rand_bit_t(N) or vsc.rand_int32_t() etc.
-    # Use a list of tuples for ordered matching (more specific patterns first)
-    type_patterns = [
-        # Parameterized types (must come before fixed-width types)
-        (r'vsc\.rand_bit_t\((\d+)\)', 'bit', lambda m: int(m.group(1)), False),
-        (r'vsc\.randc_bit_t\((\d+)\)', 'randc_bit', lambda m: int(m.group(1)), False),
-        # Fixed-width unsigned types
-        (r'vsc\.rand_uint8_t\(\)', 'uint8', lambda m: 8, False),
-        (r'vsc\.rand_uint16_t\(\)', 'uint16', lambda m: 16, False),
-        (r'vsc\.rand_uint32_t\(\)', 'uint32', lambda m: 32, False),
-        (r'vsc\.rand_uint64_t\(\)', 'uint64', lambda m: 64, False),
-        # Fixed-width signed types
-        (r'vsc\.rand_int8_t\(\)', 'int8', lambda m: 8, True),
-        (r'vsc\.rand_int16_t\(\)', 'int16', lambda m: 16, True),
-        (r'vsc\.rand_int32_t\(\)', 'int32', lambda m: 32, True),
-        (r'vsc\.rand_int64_t\(\)', 'int64', lambda m: 64, True),
-        # Enum type
-        (r'vsc\.rand_enum_t\((\w+)\)', 'enum', lambda m: 32, False),
-    ]
-
     # Find all field declarations
-    field_decl_pattern = r'self\.(\w+)\s*=\s*(vsc\.\w+(?:_t)?\([^)]*\))'
-    for match in re.finditer(field_decl_pattern, content):
+    for match in _PATTERN_FIELD_DECL.finditer(content):
         field_name = match.group(1)
         type_expr = match.group(2)
 
-        matched = False
-        for pattern, type_name, width_fn, is_signed in type_patterns:
-            type_match = re.search(pattern, type_expr)
-            if type_match:
-                bit_width = width_fn(type_match)
-                field_specs[field_name] = FieldSpec(
-                    name=field_name,
-                    bit_width=bit_width,
-                    is_signed=is_signed,
-                    type_name=type_name
-                )
-                matched = True
-                break
-
-        if not matched:
+        type_match = _PATTERN_TYPE.search(type_expr)
+        if type_match:
+            tag = type_match.lastgroup
+            type_name, bit_width, is_signed = _TYPE_META[tag]
+            if bit_width is None:
+                bit_width = int(type_match.group(tag + '_w'))
+            field_specs[field_name] = FieldSpec(
+                name=field_name,
+                bit_width=bit_width,
+                is_signed=is_signed,
+                type_name=type_name
+            )
+        else:
             # Default to 32-bit signed if unknown type
             field_specs[field_name] = FieldSpec(
                 name=field_name,
@@ -221,8 +230,7 @@ def parse_pyvsc_file(module_name: str) -> Dict[str, FieldSpec]:
             )
 
     # Parse constraint ranges: self.field in vsc.rangelist(vsc.rng(min, max))
-    range_pattern = r'self\.(\w+)\s+in\s+vsc\.rangelist\(vsc\.rng\((-?\d+),\s*(-?\d+)\)\)'
-    for match in re.finditer(range_pattern, content):
+    for match in _PATTERN_RANGE.finditer(content):
         field_name = match.group(1)
         spec_min = int(match.group(2))
         spec_max = int(match.group(3))
@@ -240,8 +248,7 @@ def parse_pyvsc_file(module_name: str) -> Dict[str, FieldSpec]:
 
     # Parse discrete value constraints: self.field in vsc.rangelist(val1, val2, ...)
     # Handle multi-line patterns with nested parentheses
-    discrete_pattern = r'self\.(\w+)\s+in\s+vsc\.rangelist\(([^)]+(?:\([^)]*\)[^)]*)*)\)'
-    for match in re.finditer(discrete_pattern, content):
+    for match in _PATTERN_DISCRETE.finditer(content):
         field_name = match.group(1)
         values_str = match.group(2)
 
@@ -259,7 +266,7 @@ def parse_pyvsc_file(module_name: str) -> Dict[str, FieldSpec]:
             except ValueError:
                 # Could be an enum reference like YuvFormat.YUV_444
                 # Try to extract the value from enum definition
-                enum_match = re.search(r'(\w+)\.(\w+)', val)
+                enum_match = _PATTERN_ENUM_REF.search(val)
                 if enum_match:
                     enum_class = enum_match.group(1)
                     enum_member = enum_match.group(2)
@@ -300,23 +307,16 @@ def parse_hw_field_file(filepath: str) -> List[Tuple[str, str]]:
     """Parse hw_field.txt to get list of (field_name, default_value) tuples."""
     fields = []
     with open(filepath, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            # Remove comments (everything after #)
-            if '#' in line:
-                line = line[:line.index('#')]
-            line = line.strip()
-            if not line:
+        for line in f:
+            # Drop comments (everything after #); tokens past the second are ignored
+            parts = line.split('#', 1)[0].split(None, 2)
+            if not parts:
                 continue
-            parts = line.split()
             if len(parts) >= 2:
-                field_name = parts[0]
-                default_value = parts[1]
-                fields.append((field_name, default_value))
-            elif len(parts) == 1:
+                fields.append((parts[0], parts[1]))
+            else:
                 # Field name only, default to 0
                 fields.append((parts[0], '0'))
-            else:
-                print(f"Warning: Skipping invalid line {line_num}: {line}")
     return fields
 
 
@@ -338,16 +338,64 @@ def load_pyvsc_class(module_name: str, class_name: str):
         sys.exit(1)
 
 
-def get_field_value(obj, field_name: str) -> Optional[Any]:
-    """Get the value of a field from the randomized object."""
-    try:
-        value = getattr(obj, field_name)
-        # Handle PyVSC field types - they may have a .val property or be directly accessible
+def _build_field_getters(
+    obj, fields: List[Tuple[str, Optional[str]]],
+) -> List[Tuple[str, Optional[str], Optional[Callable[[Any], Any]]]]:
+    """Resolve once how each field is read from obj, for reuse across runs.
+
+    PyVSC field types expose their value through a .val property, so such
+    fields are read through it and all others directly. Fields missing
+    from obj get no getter, so their default value is used.
+
+    Returns a list of (field_name, default_value, getter) tuples.
+    """
+    getters = []
+    for field_name, default_value in fields:
+        try:
+            value = getattr(obj, field_name)
+        except AttributeError:
+            getters.append((field_name, default_value, None))
+            continue
         if hasattr(value, 'val'):
-            return value.val
-        return value
-    except AttributeError:
-        return None
+            getter = attrgetter(f"{field_name}.val")
+        else:
+            getter = attrgetter(field_name)
+        getters.append((field_name, default_value, getter))
+    return getters
+
+
+def _read_field_values(
+    obj, getters: List[Tuple[str, Any, Optional[Callable[[Any], Any]]]],
+) -> Dict[str, Any]:
+    """Read fields through *getters*, using the default for any obj lacks or
+    that is None."""
+    values: Dict[str, Any] = {}
+    for name, default_value, getter in getters:
+        value = None
+        if getter is not None:
+            try:
+                value = getter(obj)
+            except AttributeError:
+                pass
+        values[name] = value if value is not None else default_value
+    return values
+
+
+def _read_present_values(
+    obj, getters: List[Tuple[str, Any, Optional[Callable[[Any], Any]]]],
+) -> Dict[str, Any]:
+    """Read fields through *getters*, skipping ones obj lacks or that are None."""
+    values: Dict[str, Any] = {}
+    for name, _, getter in getters:
+        if getter is None:
+            continue
+        try:
+            value = getter(obj)
+        except AttributeError:
+            continue
+        if value is not None:
+            values[name] = value
+    return values
 
 
 def _clamp_with_range_map(
@@ -370,6 +418,8 @@ def _clamp_with_range_map(
 def generate_test_vector(obj, fields: List[Tuple[str, str]], run_id: int,
                          field_stats: Dict[str, FieldStats],
                          param_overrides: Optional[Dict] = None,
+                         field_getters: Optional[List[Tuple[str, str, Optional[Callable]]]] = None,
+                         override_getters: Optional[List[Tuple[str, Any, Optional[Callable]]]] = None,
                          ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Generate a single test vector by randomizing the object.
 
@@ -377,6 +427,10 @@ def generate_test_vector(obj, fields: List[Tuple[str, str]], run_id: int,
     available), overrides are applied during randomization and as a
     post-clamp fallback.
 
+    If *field_getters* / *override_getters* (from _build_field_getters) are
+    provided, hw_field / overridden values are read through them instead of
+    probing each attribute on every run.
+
     Returns:
         A tuple of (vector, override_values) where *vector* contains the
         hw_field values and *override_values* contains the overridden field
@@ -393,16 +447,13 @@ def generate_test_vector(obj, fields: List[Tuple[str, str]], run_id: int,
         print(f"Warning: Randomization failed for run {run_id}: {e}")
         print("  Using default/previous values")
 
-    vector = {}
-    for field_name, default_value in fields:
-        value = get_field_value(obj, field_name)
-        if value is not None:
-            vector[field_name] = value
-        else:
-            # Field not found in object, use default
-            vector[field_name] = default_value
+    if field_getters is None:
+        field_getters = _build_field_getters(obj, fields)
+
+    vector = _read_field_values(obj, field_getters)
 
-        # Collect value for statistics
+    # Collect values for statistics
+    for field_name, _, _ in field_getters:
         if field_name in field_stats:
             field_stats[field_name].values.append(vector[field_name])
 
@@ -413,10 +464,10 @@ def generate_test_vector(obj, fields: List[Tuple[str, str]], run_id: int,
     # Extract overridden parameter values from the same randomization run
     override_values: Dict[str, Any] = {}
     if param_overrides:
-        for name in param_overrides:
-            value = get_field_value(obj, name)
-            if value is not None:
-                override_values[name] = value
+        if override_getters is None:
+            override_getters = _build_field_getters(
+                obj, [(name, None) for name in param_overrides])
+        override_values = _read_present_values(obj, override_getters)
         if _HAS_OVERRIDE:
             override_values = patch_vector_with_overrides(
                 override_values, param_overrides
@@ -425,17 +476,56 @@ def generate_test_vector(obj, fields: List[Tuple[str, str]], run_id: int,
     return vector, override_values
 
 
-def _randomize_worker(args_tuple):
-    """Worker function for parallel randomization.
+# Per-process worker state, set once by _init_worker
+_worker_class = None
+_worker_fields: List[Tuple[str, str]] = []
+_worker_seed: Optional[int] = None
+_worker_override_ranges: Dict[str, Tuple[int, int]] = {}
+# Resolved from the first instance a worker creates (see _build_field_getters)
+_worker_field_getters: Optional[List[Tuple[str, str, Optional[Callable]]]] = None
+_worker_override_getters: Optional[List[Tuple[str, Any, Optional[Callable]]]] = None
+# Instance reused across unseeded runs (see _randomize_worker)
+_worker_obj = None
+
 
-    Creates a fresh PyVSC instance per call to avoid any shared state.
-    Each worker independently imports the module and instantiates the class.
+def _init_worker(module_name: str, class_name: str, fields: List[Tuple[str, str]],
+                 seed: Optional[int], override_ranges: Dict[str, Tuple[int, int]]):
+    """Pool initializer: import the PyVSC class and keep the batch arguments.
 
-    The *override_ranges* element (6th) is a dict:
+    Runs once per worker process, so each task only carries its run_id.
+
+    The *override_ranges* dict:
         {field_name: (override_min, override_max)}
-    used to constrain randomization in worker processes.
+    is used to constrain randomization in worker processes.
+    """
+    global _worker_class, _worker_fields, _worker_seed, _worker_override_ranges
+    global _worker_field_getters, _worker_override_getters, _worker_obj
+    if '.' not in sys.path:
+        sys.path.insert(0, '.')
+    module = importlib.import_module(module_name)
+    _worker_class = getattr(module, class_name)
+    _worker_fields = fields
+    _worker_seed = seed
+    _worker_override_ranges = override_ranges
+    _worker_field_getters = None
+    _worker_override_getters = None
+    _worker_obj = None
+
+
+def _randomize_worker(run_id: int):
+    """Worker function for parallel randomization.
+
+    The class and batch arguments come from _init_worker. Without a seed,
+    each worker constructs its PyVSC instance once and re-randomizes it for
+    every run, like the serial path. With a seed, a fresh instance is created
+    per run: PyVSC keeps its own RNG state on the instance, so only a new
+    instance built after random.seed(seed + run_id) makes the run's values
+    independent of which worker handled it.
     """
-    module_name, class_name, fields, run_id, seed, override_ranges = args_tuple
+    global _worker_field_getters, _worker_override_getters, _worker_obj
+    fields = _worker_fields
+    seed = _worker_seed
+    override_ranges = _worker_override_ranges
 
     # Per-run deterministic seed
     if seed is not None:
@@ -443,12 +533,13 @@ def _randomize_worker(args_tuple):
 
     t0 = time.perf_counter()
 
-    # Import and instantiate in worker process
-    if '.' not in sys.path:
-        sys.path.insert(0, '.')
-    module = importlib.import_module(module_name)
-    pyvsc_class = getattr(module, class_name)
-    obj = pyvsc_class()
+    # Instantiate in worker process
+    if seed is not None:
+        obj = _worker_class()
+    else:
+        if _worker_obj is None:
+            _worker_obj = _worker_class()
+        obj = _worker_obj
 
     # Randomize (apply override ranges at solve-time when provided)
     failed = False
@@ -472,38 +563,36 @@ def _randomize_worker(args_tuple):
         except Exception:
             pass
 
-    # Extract field values
-    vector = {}
-    for field_name, default_value in fields:
-        value = get_field_value(obj, field_name)
-        if value is not None:
-            vector[field_name] = value
-        else:
-            vector[field_name] = default_value
+    # Extract field values; every instance shares the class layout, so the
+    # getters resolved on this worker's first instance serve all its runs
+    if _worker_field_getters is None:
+        _worker_field_getters = _build_field_getters(obj, fields)
+        _worker_override_getters = _build_field_getters(
+            obj, [(name, None) for name in (override_ranges or {})])
+    vector = _read_field_values(obj, _worker_field_getters)
 
     # Extract overridden parameter values for companion file
-    override_values: Dict[str, Any] = {}
-    for name in (override_ranges or {}):
-        value = get_field_value(obj, name)
-        if value is not None:
-            override_values[name] = value
+    override_values = _read_present_values(obj, _worker_override_getters)
 
     if override_ranges:
         vector = _clamp_with_range_map(vector, override_ranges)
         override_values = _clamp_with_range_map(override_values, override_ranges)
 
     elapsed = time.perf_counter() - t0
-    return run_id, vector, elapsed, failed, override_values
+    # Values only, in field order: the field names need not be pickled per run
+    return run_id, list(vector.values()), elapsed, failed, override_values
 
 
 def write_test_vector_file(vector: Dict[str, Any], output_path: str, run_id: int):
     """Write a single test vector to a file."""
+    # Build the whole file first so it goes out in a single write call
+    content = "".join([f"{field_name} {value}\n" for field_name, value in vector.items()])
     with open(output_path, 'w') as f:
-        for field_name, value in vector.items():
-            f.write(f"{field_name} {value}\n")
+        f.write(content)
 
 
-def write_overrides_file(override_values: Dict[str, Any], output_path: str, run_id: int):
+def write_overrides_file(override_values: Dict[str, Any], output_path: str, run_id: int,
+                         timestamp: Optional[str] = None):
     """Write overridden parameter values for a single run to a companion file.
 
     This produces a file alongside each config_NNNN.txt containing the
@@ -513,18 +602,27 @@ def write_overrides_file(override_values: Dict[str, Any], output_path: str, run_
         override_values: Dict mapping parameter name -> randomized value.
         output_path: Destination file path (e.g. config_0000_overrides.txt).
         run_id: Run index for the header comment.
+        timestamp: Pre-formatted "Generated:" time shared by all runs
+            (default: the current time).
     """
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    lines = [
+        f"# Override Parameter Values - Run {run_id}\n",
+        f"# Generated: {timestamp}\n",
+        "#\n",
+    ]
+    lines.extend([f"{name} {value}\n" for name, value in override_values.items()])
     with open(output_path, 'w') as f:
-        f.write(f"# Override Parameter Values - Run {run_id}\n")
-        f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("#\n")
-        for name, value in override_values.items():
-            f.write(f"{name} {value}\n")
+        f.write("".join(lines))
 
 
 def write_summary_file(vectors: List[Dict[str, Any]], output_dir: str,
                        fields: List[Tuple[str, str]], field_stats: Dict[str, FieldStats]):
-    """Write a summary CSV file with all test vectors and statistics."""
+    """Write a summary CSV file with all test vectors and statistics.
+
+    Expects FieldStats.compute_stats() to have been run on *field_stats*.
+    """
     summary_path = os.path.join(output_dir, "test_vectors_summary.csv")
 
     with open(summary_path, 'w') as f:
@@ -546,7 +644,6 @@ def write_summary_file(vectors: List[Dict[str, Any]], output_dir: str,
         for field_name, _ in fields:
             stats = field_stats.get(field_name)
             if stats:
-                stats.compute_stats()
                 # Spec values
                 reg_bit = stats.spec.bit_width if stats.spec else "N/A"
                 spec_min = stats.spec.spec_min if stats.spec and stats.spec.spec_min is not None else "N/A"
@@ -732,6 +829,7 @@ Examples:
   %(prog)s example_sv_classes IspYuv2rgbCfg hw_field.txt 100 ./output
   %(prog)s my_constraints MyClass fields.txt 50 --seed 12345
   %(prog)s example_sv_classes IspYuv2rgbCfg hw_field.txt 100 -j -1  # all cores
+  %(prog)s example_sv_classes IspYuv2rgbCfg hw_field.txt 10000 --format csv  # no per-run files
         """
     )
 
@@ -750,7 +848,9 @@ Examples:
     parser.add_argument('--prefix', default='config',
                         help='Prefix for output files (default: config)')
     parser.add_argument('--format', choices=['txt', 'csv', 'both'], default='both',
-                        help='Output format (default: both)')
+                        help='Output format (default: both). "csv" writes only the '
+                             'summary/statistics CSVs and skips the per-run txt '
+                             'files — recommended for large num_runs')
     parser.add_argument('--jobs', '-j', type=int, default=-1,
                         help='Number of parallel workers (default: 1, use -1 for all cores)')
     parser.add_argument('--overrides', '--top-params', default=None, metavar='CSV',
@@ -918,7 +1018,8 @@ Examples:
         print(f"  WARNING: Validation randomize failed: {e}")
         print(f"  Proceeding anyway — some runs may fail.")
 
-    # Generate test vectors
+    # Generate test vectors; companion files share one "Generated:" stamp
+    run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     print(f"\nGenerating {args.num_runs} test vectors (jobs={num_jobs})...")
     gen_start = time.perf_counter()
     vectors = [None] * args.num_runs
@@ -926,17 +1027,25 @@ Examples:
     total_solve_time = 0.0
 
     if num_jobs > 1:
-        # Parallel execution: each worker creates its own instance and
-        # enforces active override ranges at solve-time.
-        worker_args = [
-            (args.pyvsc_module, args.class_name, fields, run_id, args.seed,
-             active_override_ranges)
-            for run_id in range(args.num_runs)
-        ]
+        # Parallel execution: each worker imports the class once (pool
+        # initializer) and enforces active override ranges at solve-time.
+        # Unseeded workers reuse one instance; seeded runs each build a
+        # fresh one (see _randomize_worker). Tasks are just run ids, in chunks.
         all_override_values = [None] * args.num_runs  # TopParam values per run
-        with multiprocessing.Pool(processes=num_jobs) as pool:
-            for run_id, vector, elapsed, failed, override_values in pool.imap_unordered(
-                    _randomize_worker, worker_args):
+        chunksize = max(1, args.num_runs // (4 * num_jobs))
+        # Workers return vector values in this (deduplicated) field order
+        vector_names = list(dict.fromkeys(name for name, _ in fields))
+        # Resolve which fields collect statistics once, not per result
+        tracked = [(name, field_stats[name].values.append)
+                   for name, _ in fields if name in field_stats]
+        done = 0
+        with multiprocessing.Pool(
+                processes=num_jobs, initializer=_init_worker,
+                initargs=(args.pyvsc_module, args.class_name, fields,
+                          args.seed, active_override_ranges)) as pool:
+            for run_id, values, elapsed, failed, override_values in pool.imap_unordered(
+                    _randomize_worker, range(args.num_runs), chunksize=chunksize):
+                vector = dict(zip(vector_names, values))
                 vectors[run_id] = vector
                 all_override_values[run_id] = override_values
                 total_solve_time += elapsed
@@ -944,13 +1053,11 @@ Examples:
                     successful += 1
 
                 # Collect stats
-                for field_name, _ in fields:
-                    if field_name in field_stats:
-                        field_stats[field_name].values.append(
-                            vector.get(field_name, ''))
+                for field_name, append in tracked:
+                    append(vector.get(field_name, ''))
 
                 # Progress
-                done = sum(1 for v in vectors if v is not None)
+                done += 1
                 if done % max(1, args.num_runs // 10) == 0 or done == args.num_runs:
                     print(f"  Generated {done}/{args.num_runs} vectors")
 
@@ -966,14 +1073,21 @@ Examples:
                         args.output_dir,
                         f"{args.prefix}_{run_id:04d}_overrides.txt")
                     write_overrides_file(
-                        all_override_values[run_id], top_path, run_id)
+                        all_override_values[run_id], top_path, run_id,
+                        run_timestamp)
     else:
-        # Serial execution: reuse single instance (no state accumulation issue)
+        # Serial execution: reuse single instance (no state accumulation issue),
+        # so how each field is read can be resolved once for all runs
+        field_getters = _build_field_getters(obj, fields)
+        override_getters = _build_field_getters(
+            obj, [(name, None) for name in (param_overrides or {})])
         for run_id in range(args.num_runs):
             t_iter = time.perf_counter()
             vector, override_values = generate_test_vector(
                 obj, fields, run_id, field_stats,
-                param_overrides=param_overrides)
+                param_overrides=param_overrides,
+                field_getters=field_getters,
+                override_getters=override_getters)
             elapsed = time.perf_counter() - t_iter
             total_solve_time += elapsed
             vectors[run_id] = vector
@@ -989,7 +1103,8 @@ Examples:
                     top_path = os.path.join(
                         args.output_dir,
                         f"{args.prefix}_{run_id:04d}_overrides.txt")
-                    write_overrides_file(override_values, top_path, run_id)
+                    write_overrides_file(override_values, top_path, run_id,
+                                         run_timestamp)
 
             successful += 1
 
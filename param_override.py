@@ -81,11 +81,13 @@ def load_overrides(csv_path: str) -> Dict[str, OverrideSpec]:
     The CSV is expected to have columns:
         Name, NormalValue, MinValue, MaxValue, OverrideMin, OverrideMax, TestConstraint
     """
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"Override CSV not found: {csv_path}")
+    try:
+        f = open(csv_path, "r", newline="", encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Override CSV not found: {csv_path}") from None
 
     overrides: Dict[str, OverrideSpec] = {}
-    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+    with f:
         reader = csv.DictReader(f)
         for row in reader:
             name = row.get("Name", "").strip()
@@ -263,6 +265,17 @@ def patch_vector_with_overrides(
     return patched
 
 
+# SV range constraint line: (<name> >= <lo> && <name> <= <hi>); <trail>
+# Matched MULTILINE over the whole file, so whitespace is [^\S\n] and a
+# match never spans lines
+_PATTERN_SV_RANGE_LINE = re.compile(
+    r"^(?P<indent>[^\S\n]*)\([^\S\n]*(?P<name>\w+)[^\S\n]*>=[^\S\n]*(?P<lo>-?\d+)"
+    r"[^\S\n]*&&[^\S\n]*(?P=name)[^\S\n]*<=[^\S\n]*(?P<hi>-?\d+)[^\S\n]*\)"
+    r"[^\S\n]*;[^\S\n]*(?P<trail>.*)$",
+    re.MULTILINE,
+)
+
+
 def apply_overrides_to_sv_file(
     sv_path: str,
     overrides: Dict[str, OverrideSpec],
@@ -282,36 +295,22 @@ def apply_overrides_to_sv_file(
     Returns:
         Tuple ``(matched_constraints, updated_constraints)``.
     """
-    if not os.path.exists(sv_path):
-        raise FileNotFoundError(f"SystemVerilog source not found: {sv_path}")
-
-    line_re = re.compile(
-        r"^(?P<indent>\s*)\(\s*(?P<name>\w+)\s*>=\s*(?P<lo>-?\d+)\s*&&\s*"
-        r"(?P=name)\s*<=\s*(?P<hi>-?\d+)\s*\)\s*;\s*(?P<trail>.*)$"
-    )
-
-    with open(sv_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    try:
+        with open(sv_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SystemVerilog source not found: {sv_path}") from None
 
     matched = 0
     updated = 0
-    out_lines: List[str] = []
-
-    for line in lines:
-        nl = "\n" if line.endswith("\n") else ""
-        body = line[:-1] if nl else line
-        m = line_re.match(body)
-
-        if not m:
-            out_lines.append(line)
-            continue
 
+    def _rewrite(m: re.Match) -> str:
+        nonlocal matched, updated
         matched += 1
         name = m.group("name")
         spec = overrides.get(name)
         if spec is None:
-            out_lines.append(line)
-            continue
+            return m.group(0)
 
         trail = m.group("trail").strip()
         base = (
@@ -320,21 +319,23 @@ def apply_overrides_to_sv_file(
         )
         if trail:
             base = f"{base} {trail}"
-        new_line = f"{base}{nl}"
-        out_lines.append(new_line)
 
         old_lo = int(m.group("lo"))
         old_hi = int(m.group("hi"))
         if old_lo != spec.override_min or old_hi != spec.override_max:
             updated += 1
+        return base
+
+    # One pass of the regex engine over the whole file
+    new_text = _PATTERN_SV_RANGE_LINE.sub(_rewrite, text)
 
     if updated > 0:
         if backup:
             bak_path = f"{sv_path}.bak"
             with open(bak_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+                f.write(text)
         with open(sv_path, "w", encoding="utf-8") as f:
-            f.writelines(out_lines)
+            f.write(new_text)
 
     return matched, updated
 
@@ -343,6 +344,34 @@ def apply_overrides_to_sv_file(
 # Generate full-field override CSV from PyVSC source
 # ---------------------------------------------------------------------------
 
+# One pass over the PyVSC source for both shapes, told apart by which groups
+# matched:
+#   self.<field> = vsc.<type>(...)                      -> name, decl
+#   self.<field> in vsc.rangelist(vsc.rng(<lo>, <hi>))  -> name, lo, hi
+_PATTERN_DECL_OR_RANGE = re.compile(
+    r'self\.(?P<name>\w+)(?:\s*=\s*(?P<decl>vsc\.\w+(?:_t)?\([^)]*\))'
+    r'|\s+in\s+vsc\.rangelist\(vsc\.rng\((?P<lo>-?\d+),\s*(?P<hi>-?\d+)\)\))'
+)
+
+# (tag, pattern, is_signed, bit_width) per rand type; bit_width None means the
+# width is captured by the "<tag>_w" group
+_RAND_TYPES = [
+    ('bit', r'vsc\.rand_bit_t\((?P<bit_w>\d+)\)', False, None),
+    ('randc_bit', r'vsc\.randc_bit_t\((?P<randc_bit_w>\d+)\)', False, None),
+    ('uint8', r'vsc\.rand_uint8_t\(\)', False, 8),
+    ('uint16', r'vsc\.rand_uint16_t\(\)', False, 16),
+    ('uint32', r'vsc\.rand_uint32_t\(\)', False, 32),
+    ('uint64', r'vsc\.rand_uint64_t\(\)', False, 64),
+    ('int8', r'vsc\.rand_int8_t\(\)', True, 8),
+    ('int16', r'vsc\.rand_int16_t\(\)', True, 16),
+    ('int32', r'vsc\.rand_int32_t\(\)', True, 32),
+    ('int64', r'vsc\.rand_int64_t\(\)', True, 64),
+    ('enum', r'vsc\.rand_enum_t\(\w+\)', False, 32),
+]
+_PATTERN_RAND_TYPE = re.compile('|'.join(f'(?P<{tag}>{pat})' for tag, pat, _, _ in _RAND_TYPES))
+_RAND_TYPE_META = {tag: (is_signed, bit_width) for tag, _, is_signed, bit_width in _RAND_TYPES}
+
+
 def generate_override_csv_from_pyvsc(
     pyvsc_path: str,
     csv_path: str,
@@ -359,41 +388,31 @@ def generate_override_csv_from_pyvsc(
 
     Returns the generated overrides dict.
     """
-    if not os.path.exists(pyvsc_path):
-        raise FileNotFoundError(f"PyVSC source not found: {pyvsc_path}")
-
-    with open(pyvsc_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # --- Extract field declarations ---
-    type_patterns = [
-        (r'vsc\.rand_bit_t\((\d+)\)', False, lambda m: int(m.group(1))),
-        (r'vsc\.randc_bit_t\((\d+)\)', False, lambda m: int(m.group(1))),
-        (r'vsc\.rand_uint8_t\(\)', False, lambda _: 8),
-        (r'vsc\.rand_uint16_t\(\)', False, lambda _: 16),
-        (r'vsc\.rand_uint32_t\(\)', False, lambda _: 32),
-        (r'vsc\.rand_uint64_t\(\)', False, lambda _: 64),
-        (r'vsc\.rand_int8_t\(\)', True, lambda _: 8),
-        (r'vsc\.rand_int16_t\(\)', True, lambda _: 16),
-        (r'vsc\.rand_int32_t\(\)', True, lambda _: 32),
-        (r'vsc\.rand_int64_t\(\)', True, lambda _: 64),
-        (r'vsc\.rand_enum_t\(\w+\)', False, lambda _: 32),
-    ]
+    try:
+        with open(pyvsc_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PyVSC source not found: {pyvsc_path}") from None
 
+    # --- Extract field declarations and constraint ranges ---
     fields: Dict[str, dict] = {}
-    field_decl_pattern = r'self\.(\w+)\s*=\s*(vsc\.\w+(?:_t)?\([^)]*\))'
-    for match in re.finditer(field_decl_pattern, content):
-        field_name = match.group(1)
-        type_expr = match.group(2)
+    ranges: Dict[str, Tuple[int, int]] = {}
+    for match in _PATTERN_DECL_OR_RANGE.finditer(content):
+        field_name = match.group('name')
+        type_expr = match.group('decl')
+        if type_expr is None:
+            # Applied after the scan, so a range may precede its declaration
+            ranges[field_name] = (int(match.group('lo')), int(match.group('hi')))
+            continue
 
         bit_width = 32
         is_signed = False
-        for pattern, signed, width_fn in type_patterns:
-            type_match = re.search(pattern, type_expr)
-            if type_match:
-                bit_width = width_fn(type_match)
-                is_signed = signed
-                break
+        type_match = _PATTERN_RAND_TYPE.search(type_expr)
+        if type_match:
+            tag = type_match.lastgroup
+            is_signed, bit_width = _RAND_TYPE_META[tag]
+            if bit_width is None:
+                bit_width = int(type_match.group(tag + '_w'))
 
         if is_signed:
             type_max = (1 << (bit_width - 1)) - 1
@@ -411,12 +430,7 @@ def generate_override_csv_from_pyvsc(
             'spec_max': None,
         }
 
-    # --- Extract constraint ranges ---
-    range_pattern = r'self\.(\w+)\s+in\s+vsc\.rangelist\(vsc\.rng\((-?\d+),\s*(-?\d+)\)\)'
-    for match in re.finditer(range_pattern, content):
-        field_name = match.group(1)
-        spec_min = int(match.group(2))
-        spec_max = int(match.group(3))
+    for field_name, (spec_min, spec_max) in ranges.items():
         if field_name in fields:
             fields[field_name]['spec_min'] = spec_min
             fields[field_name]['spec_max'] = spec_max
@@ -385,8 +385,8 @@ class SVParser:
         """Check if name is a valid field name (not a keyword or garbage)."""
         if not name:
             return False
-        # Must be a valid identifier
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
+        # Must be a valid (ASCII) identifier
+        if not (name.isascii() and name.isidentifier()):
             return False
         # Must not be a reserved word or look like garbage
         invalid_names = {'format', 'before', 'inside', 'solve', 'if', 'else',
@@ -3011,7 +3011,7 @@ from typing import Optional'''
     @staticmethod
     def _to_python_class_name(sv_name: str) -> str:
         """Convert SV name to Python class name (PascalCase)."""
-        name = re.sub(r'_[te]$', '', sv_name)
+        name = sv_name[:-2] if sv_name.endswith(('_t', '_e')) else sv_name
         return ''.join(part.capitalize() for part in name.split('_'))
 
 